@@ -1,28 +1,297 @@
+from functools import partial, reduce as _reduce
+from itertools import chain, dropwhile, islice, takewhile
 from typing import Any, Callable, Generic, Iterable, Iterator, List, Tuple, TypeVar, Union
+import ast
+import inspect
+import operator
+import re
 import time
 
+try:
+    import numpy as _np
+except ImportError:
+    _np = None
+
+try:
+    from numba import njit as _njit
+except ImportError:
+    _njit = None
+
 T = TypeVar("T")
 U = TypeVar("U")
 
+_MISSING = object()
+"""Sentinel used where None is a valid stream value."""
+
+_ADD_CODE = (lambda x, y: x + y).__code__.co_code
+_MUL_CODE = (lambda x, y: x * y).__code__.co_code
+
+_NUMBA_KERNELS = {}
+"""Compiled numeric reduction kernels, built on first use."""
+
+
+def _arith_op(reducer: Callable) -> Union[str, None]:
+    """Recognizes common arithmetic reducers; returns 'add', 'mul' or None."""
+    if reducer is operator.add:
+        return "add"
+    if reducer is operator.mul:
+        return "mul"
+
+    code = getattr(reducer, "__code__", None)
+    if code is not None and code.co_argcount == 2 and not code.co_freevars:
+        if code.co_code == _ADD_CODE:
+            return "add"
+        if code.co_code == _MUL_CODE:
+            return "mul"
+
+    return None
+
+
+def _numba_kernel(op: str) -> Union[Callable, None]:
+    """
+    Returns a compiled reduction kernel for the given arithmetic op,
+    or None when numba is not available. Kernels are cached on disk
+    (cache=True) so the compilation cost is only paid once.
+    """
+    if _njit is None:
+        return None
+
+    kernel = _NUMBA_KERNELS.get(op)
+
+    if kernel is None:
+        if op == "add":
+            @_njit(cache=True)
+            def kernel(a):
+                s = a[0]
+                for i in range(1, a.size):
+                    s += a[i]
+                return s
+        elif op == "mul":
+            @_njit(cache=True)
+            def kernel(a):
+                s = a[0]
+                for i in range(1, a.size):
+                    s *= a[i]
+                return s
+        else:
+            return None
+
+        _NUMBA_KERNELS[op] = kernel
+
+    return kernel
+
+
+_UFUNC_MAP = {}
+"""Vectorized equivalents of common one-argument lambdas, by fingerprint."""
+
+if _np is not None:
+    _UFUNC_MAP = {
+        "x * x": _np.square,
+        "x ** 2": _np.square,
+        "x + x": lambda a: a + a,
+        "2 * x": lambda a: a + a,
+        "x * 2": lambda a: a + a,
+        "-x": _np.negative,
+        "abs(x)": _np.abs,
+    }
+
+_COMPARE_OPS = {
+    "<": operator.lt,
+    "<=": operator.le,
+    ">": operator.gt,
+    ">=": operator.ge,
+    "==": operator.eq,
+    "!=": operator.ne,
+}
+
+_COMPARE_RE = re.compile(r"^x (<|<=|>|>=|==|!=) (-?\d+(?:\.\d+)?)$")
+"""Matches predicate fingerprints comparing x against a numeric constant."""
+
+
+def _lambda_fingerprint(function: Callable) -> Union[str, None]:
+    """
+    Returns the normalized body source of a one-argument lambda
+    ('x * x', 'x > 5', ...), or None when it cannot be recovered.
+    """
+    code = getattr(function, "__code__", None)
+
+    if code is None or code.co_argcount != 1 or code.co_freevars:
+        return None
+
+    # Free and global variables may change between calls; only the
+    # builtins used by the registry are allowed to appear.
+    if not set(code.co_names) <= {"abs"}:
+        return None
+
+    try:
+        tree = ast.parse(inspect.getsource(function).strip())
+    except (OSError, SyntaxError, TypeError, ValueError):
+        return None
+
+    lambdas = [node for node in ast.walk(tree) if isinstance(node, ast.Lambda)]
+
+    if len(lambdas) != 1:
+        return None
+
+    argument = lambdas[0].args.args[0].arg
+
+    for node in ast.walk(lambdas[0].body):
+        if isinstance(node, ast.Name) and node.id == argument:
+            node.id = "x"
+
+    return ast.unparse(lambdas[0].body)
+
+
+def _vector_mask(fingerprint: Union[str, None], array) -> Union[Any, None]:
+    """
+    Returns the boolean mask for a constant-comparison predicate
+    fingerprint applied to the array, or None on no match.
+    """
+    if fingerprint is None:
+        return None
+
+    match = _COMPARE_RE.match(fingerprint)
+
+    if match is None:
+        return None
+
+    compare = _COMPARE_OPS[match.group(1)]
+    return compare(array, ast.literal_eval(match.group(2)))
+
+
+def _fused_source(kinds: Tuple[str, ...], terminal: str) -> str:
+    """
+    Builds the source of a single loop inlining the given sequence of
+    map/filter stages, ended by the given terminal ('sink' or 'reduce').
+    """
+    names = ["_f%d" % i for i in range(len(kinds))]
+
+    # Runs of the same kind fold into one statement, so adjacent filters
+    # share a single conditional and adjacent maps nest into one call.
+    stages = []
+    index = 0
+    while index < len(kinds):
+        end = index
+        while end < len(kinds) and kinds[end] == kinds[index]:
+            end += 1
+
+        group = names[index:end]
+
+        if kinds[index] == "filter":
+            stages.append("if not (%s): continue" % " and ".join("%s(x)" % name for name in group))
+        else:
+            call = "x"
+            for name in group:
+                call = "%s(%s)" % (name, call)
+            stages.append("x = %s" % call)
+
+        index = end
+
+    if terminal == "reduce":
+        lines = ["def _fused(_src, _ops, _reducer, _acc, _missing):"]
+    else:
+        lines = ["def _fused(_src, _ops, _sink):"]
+
+    if names:
+        lines.append("    %s%s = _ops" % (", ".join(names), "," if len(names) == 1 else ""))
+
+    if terminal == "reduce":
+        # Seed the accumulator from the first passing element up front,
+        # so the loop body is a bare reducer call with no per-element branch.
+        lines.append("    _it = iter(_src)")
+        lines.append("    if _acc is _missing:")
+        lines.append("        for x in _it:")
+        lines.extend("            " + stage for stage in stages)
+        lines.append("            _acc = x")
+        lines.append("            break")
+        lines.append("    for x in _it:")
+        lines.extend("        " + stage for stage in stages)
+        lines.append("        _acc = _reducer(_acc, x)")
+        lines.append("    return _acc")
+    else:
+        lines.append("    for x in _src:")
+        lines.extend("        " + stage for stage in stages)
+        lines.append("        _sink(x)")
+
+    return "\n".join(lines)
+
+
+_PIPELINE_CACHE = {}
+"""Compiled fused loops, keyed by (op kinds, terminal)."""
+
+
+def _compile_fused(kinds: Tuple[str, ...], terminal: str) -> Callable:
+    """
+    Returns the fused loop for the given op kinds and terminal,
+    compiling and caching it on first use. The callables are passed in
+    at call time, so every pipeline of the same shape shares one loop.
+    """
+    key = (kinds, terminal)
+    runner = _PIPELINE_CACHE.get(key)
+
+    if runner is None:
+        namespace = {}
+        exec(compile(_fused_source(kinds, terminal), "<pypes-fused>", "exec"), namespace)
+        runner = _PIPELINE_CACHE[key] = namespace["_fused"]
+
+    return runner
+
+
+def _pushdown_filters(ops: Tuple[Tuple[str, Callable, bool], ...]) -> Tuple[Tuple[str, Callable, bool], ...]:
+    """
+    Moves filters marked as independent left past the maps preceding them,
+    so elements are discarded before paying for the mapping calls.
+    A filter may only be marked independent when its predicate does not
+    depend on the output of those maps.
+    """
+    ops = list(ops)
+    swapped = True
+
+    while swapped:
+        swapped = False
+        for i in range(len(ops) - 1):
+            if ops[i][0] == "map" and ops[i + 1][0] == "filter" and ops[i + 1][2]:
+                ops[i], ops[i + 1] = ops[i + 1], ops[i]
+                swapped = True
+
+    return tuple(ops)
+
+
+def _make_zip_iters(max_arity: int = 8) -> dict:
+    """
+    Generates one zip constructor per arity, indexing the stream tuple
+    directly so hot zip loops skip the *streams unpack and intermediate
+    argument tuple of the variadic call.
+    """
+    iters = {}
+
+    for arity in range(2, max_arity + 1):
+        arguments = ", ".join("streams[%d]" % i for i in range(arity))
+        source = "def _zip%d(streams):\n    return zip(%s)" % (arity, arguments)
+        namespace = {}
+        exec(compile(source, "<pypes-zip>", "exec"), namespace)
+        iters[arity] = namespace["_zip%d" % arity]
+
+    return iters
+
+
+_ZIP_ITERS = _make_zip_iters()
+"""Fixed-arity zip constructors, keyed by stream count."""
+
 
 def _getitem(stream: "Stream[T]", position: int) -> T:
     try:
-        if type(stream) == Stream:
+        if type(stream) is Stream and not stream._ops:
             return stream._stream[position]
     except TypeError:
         pass
 
-    iter = stream.__iter__()
-    count = 0
+    iterator = stream.__iter__()
 
     try:
-        while count<position:
-            next(iter)
-            count +=1
-            
-        return next(iter)
+        return next(islice(iterator, position, None))
     except StopIteration:
-        return IndexError("Index out of bounds")
+        raise IndexError("Index out of bounds")
 
 
 class Optional(Generic[T]):
@@ -31,6 +300,8 @@ class Optional(Generic[T]):
     A value is considered present if the value is not None.
     """
 
+    __slots__ = ("value",)
+
     value: Union[T, None]
 
     def __init__(self, value: T = None) -> None:
@@ -44,7 +315,7 @@ class Optional(Generic[T]):
 
     def is_present(self) -> bool:
         """Returns true if a value is present"""
-        return self.value != None
+        return self.value is not None
 
     def value_else(self, other: T) -> T:
         """If a value is present returns the value; returns the other value otherwise."""
@@ -55,63 +326,220 @@ class Optional(Generic[T]):
         """Returns the result of the given function if a value is present; None otherwise."""
         return function(self.value) if self.is_present() else None
 
-    def stream(self) -> bool:
+    def stream(self) -> "Stream[T]":
         """Returns a 1 long Stream with a value if present; an empty Stream otherwise"""
-        return Stream(self)
+        if self.value is not None:
+            return Stream((self.value,))
+        return _EMPTY_STREAM
 
     def __sizeof__(self) -> int:
         return 1 if self.is_present() else 0
 
     def __iter__(self):
-        if self.value != None:
+        if self.value is not None:
             yield self.value
 
 
 class Stream(Generic[T]):
     """A wrapper class to pipeline functional operations."""
 
+    __slots__ = ("_stream", "_ops")
+
     _stream: Iterable[T]
     """The underlying iterable resource of this Stream."""
 
-    def __init__(self, stream: Iterable[T]) -> None:
+    _ops: Tuple[Tuple[str, Callable, bool], ...]
+    """
+    Pending map/filter stages, fused into a single loop by terminal operations.
+    Each op is a (kind, callable, independent) tuple; independent filters may
+    be pushed down past preceding maps.
+    """
+
+    def __init__(self, stream: Iterable[T], _ops: Tuple[Tuple[str, Callable, bool], ...] = ()) -> None:
         """Creates a new Stream given an iterable object."""
         super().__init__()
 
         self._stream = stream
+        self._ops = _ops
 
     def map(self, mapping: Callable[[T], U]) -> "Stream[U]":
         """Maps each element of the stream to another with the mapping function"""
-        return Stream(map(mapping, self))
+        if type(self) is Stream:
+            if self._is_vector():
+                transform = _UFUNC_MAP.get(_lambda_fingerprint(mapping))
+                if transform is not None:
+                    return Stream(transform(self._stream))
+            return Stream(self._stream, self._ops + (("map", mapping, False),))
+        return Stream(self, (("map", mapping, False),))
 
     def filter(self, predicate: Callable[[T], bool]) -> "Stream[T]":
         """Filters elements of the stream that matches the predicate."""
-        return Stream(filter(predicate, self))
+        if type(self) is Stream:
+            if self._is_vector():
+                mask = _vector_mask(_lambda_fingerprint(predicate), self._stream)
+                if mask is not None:
+                    return Stream(self._stream[mask])
+            return Stream(self._stream, self._ops + (("filter", predicate, not self._ops),))
+        return Stream(self, (("filter", predicate, True),))
+
+    def _is_vector(self) -> bool:
+        """Whether this stream is backed by an ndarray with no pending ops."""
+        return _np is not None and not self._ops and isinstance(self._stream, _np.ndarray)
+
+    def optimized(self) -> "Stream[T]":
+        """
+        Marks every pending filter as independent of the preceding maps,
+        allowing terminal operations to evaluate it before them.
+        Only use when the predicates accept the raw input elements.
+        """
+        if type(self) is not Stream:
+            return self
+
+        ops = tuple((kind, function, kind == "filter" or independent)
+                    for kind, function, independent in self._ops)
+        return Stream(self._stream, ops)
+
+    def hint_independent(self, filter_idx: int) -> "Stream[T]":
+        """
+        Marks the nth pending filter as independent of the preceding maps.
+        Only use when its predicate accepts the raw input elements.
+        """
+        if type(self) is not Stream:
+            return self
+
+        ops = []
+        count = 0
+
+        for kind, function, independent in self._ops:
+            if kind == "filter":
+                if count == filter_idx:
+                    independent = True
+                count += 1
+            ops.append((kind, function, independent))
+
+        return Stream(self._stream, tuple(ops))
+
+    def _run(self, sink: Callable[[T], Any]):
+        """Feeds each element through the fused pipeline into the sink."""
+        ops = _pushdown_filters(self._ops)
+        runner = _compile_fused(tuple(op[0] for op in ops), "sink")
+        runner(self._stream, tuple(op[1] for op in ops), sink)
+
+    def _run_reduce(self, reducer: Callable[[T, T], T], accumulator) -> T:
+        """Runs a reduction through the fused pipeline."""
+        ops = _pushdown_filters(self._ops)
+        runner = _compile_fused(tuple(op[0] for op in ops), "reduce")
+        return runner(self._stream, tuple(op[1] for op in ops), reducer, accumulator, _MISSING)
+
+    def _numeric_reduce(self, op: str):
+        """
+        Reduces through a compiled numeric kernel when the source is a
+        plain numeric sequence and numba is available.
+        Returns _MISSING when the fast path does not apply.
+        """
+        if type(self) is not Stream or self._ops:
+            return _MISSING
+
+        source = self._stream
+
+        if isinstance(source, range):
+            if _np is None:
+                return _MISSING
+            try:
+                array = _np.arange(source.start, source.stop, source.step, dtype=_np.int64)
+            except OverflowError:
+                return _MISSING
+        elif _np is not None and isinstance(source, _np.ndarray):
+            array = source
+        elif isinstance(source, list) and source:
+            if _np is None:
+                return _MISSING
+            # asarray silently promotes ints beyond int64 to a lossy
+            # float64; force int64 for all-int input and bail when it
+            # cannot hold the values.
+            try:
+                if all(type(value) is int for value in source):
+                    array = _np.asarray(source, dtype=_np.int64)
+                else:
+                    array = _np.asarray(source)
+            except (OverflowError, ValueError, TypeError):
+                return _MISSING
+        else:
+            return _MISSING
+
+        if array.ndim != 1 or array.size == 0 or array.dtype.kind not in "if":
+            return _MISSING
+
+        # int64 kernels wrap silently where Python ints would not; bail
+        # out whenever the reduction could leave the int64-safe range.
+        # The bound is computed with Python ints because np.abs wraps
+        # int64-min back onto itself.
+        if array.dtype.kind == "i":
+            largest = max(abs(int(array.min())), abs(int(array.max())))
+            if largest >= 2 ** 62:
+                return _MISSING
+            if op == "add":
+                if largest * array.size >= 2 ** 62:
+                    return _MISSING
+            elif _np.log2(_np.clip(_np.abs(array), 1, None)).sum() >= 62:
+                return _MISSING
+
+        kernel = _numba_kernel(op)
+
+        if kernel is None:
+            return _MISSING
+
+        return kernel(array)
 
     def filter_none(self) -> "Stream[T]":
         """Filters None values."""
 
-        return self.filter(lambda x: x != None)
+        return self.filter(partial(operator.is_not, None))
 
     def for_each(self, function: Callable[[T], Any]):
         """Apply the given function for each element of the stream"""
 
+        if type(self) is Stream and self._ops:
+            self._run(function)
+            return
+
         for value in self:
             function(value)
 
     def for_each_and(self, function: Callable[[T], Any], between: Callable[[], Any]):
-        iter = self.__iter__()
+        next_value = self.__iter__().__next__
 
         try:
-            value = next(iter)
+            value = next_value()
             while True:
                 function(value)
-                value = next(iter)
+                value = next_value()
                 between()
         except StopIteration:
             pass
     
     def for_each_sleep(self, function: Callable[[T], Any], secs: float):
-        self.for_each_and(function, lambda: time.sleep(secs))
+        """
+        Applies the function to each element, pacing iterations `secs`
+        apart. The callback's own runtime is deducted from each sleep,
+        so the period does not drift.
+        """
+        monotonic = time.monotonic
+        sleep = time.sleep
+        iterator = self.__iter__()
+        target = monotonic()
+
+        try:
+            function(next(iterator))
+        except StopIteration:
+            return
+
+        for value in iterator:
+            target += secs
+            delta = target - monotonic()
+            if delta > 0:
+                sleep(delta)
+            function(value)
 
     def reduce(self, reducer: Callable[[T, T], T], initial_value: T = None) -> Optional[T]:
         """
@@ -120,24 +548,48 @@ class Stream(Generic[T]):
         Returns an optional value.
         """
 
-        iter = self.__iter__()
-        try:
-            accumulator = initial_value if initial_value!=None else next(iter, None)
-        except StopIteration:
-            return Optional()
+        op = _arith_op(reducer)
+        if op is not None:
+            value = self._numeric_reduce(op)
+            if value is not _MISSING:
+                if initial_value is not None:
+                    value = reducer(initial_value, value)
+                return Optional(value)
 
-        for value in iter:
+        if type(self) is Stream and self._ops:
+            accumulator = initial_value if initial_value is not None else _MISSING
+            accumulator = self._run_reduce(reducer, accumulator)
+            return Optional() if accumulator is _MISSING else Optional(accumulator)
+
+        iterator = self.__iter__()
+
+        if initial_value is None:
+            try:
+                accumulator = next(iterator)
+            except StopIteration:
+                return Optional()
+        else:
+            accumulator = initial_value
+
+        for value in iterator:
             accumulator = reducer(accumulator, value)
 
         return Optional(accumulator)
 
     def count(self) -> int:
         """Returns the number of elements in this stream."""
-        return len(self._stream)
+        if type(self) is Stream and not self._ops:
+            hint = operator.length_hint(self._stream, -1)
+            if hint >= 0:
+                return hint
+        return sum(1 for _ in self)
+
+    def __length_hint__(self) -> int:
+        return operator.length_hint(self._stream)
 
     def join(self, separator="") -> str:
         """Maps elements to their string representation and join them using the given separator."""
-        return self.map(str).reduce(lambda x, y: x+separator+y).value_else("")
+        return separator.join(map(str, self))
 
     def sum(self, initial_value) -> T:
         """
@@ -145,15 +597,23 @@ class Stream(Generic[T]):
         Elements of this stream must support addition.
         Initial value
         """
+        if isinstance(initial_value, str):
+            return initial_value + "".join(map(str, self))
+
+        if isinstance(initial_value, (int, float)):
+            value = self._numeric_reduce("add")
+            if value is not _MISSING:
+                return initial_value + value
+            if type(self) is Stream and self._ops:
+                return self._run_reduce(operator.add, initial_value)
+            return _reduce(operator.add, self, initial_value)
+
         return self.reduce(lambda x, y: x+y, initial_value).value
 
     def first_where(self, predicate: Callable[[T], bool]) -> Optional[T]:
         """Returns an optional value. The value is the first one that matches the predicate."""
-        for value in self:
-            if predicate(value):
-                return Optional(value)
-
-        return Optional()
+        value = next(filter(predicate, self), _MISSING)
+        return Optional() if value is _MISSING else Optional(value)
 
     def only(self, length: int) -> "Stream[T]":
         return _OnlyStream(self, length)
@@ -163,11 +623,21 @@ class Stream(Generic[T]):
 
     def drop_while(self, predicate: Callable[[T], bool]) -> "Stream[T]":
         """Returns a stream where items are dropped while the predicate is true"""
-        return _DropStream(self, predicate)
+        return Stream(dropwhile(predicate, self))
 
     def take_while(self, predicate: Callable[[T], bool]) -> "Stream[T]":
         """Returns a stream where items are taken while the predicate is true"""
-        return _TakeStream(self, predicate)
+        return Stream(takewhile(predicate, self))
+
+    def cached(self) -> "Stream[T]":
+        """
+        Returns a stream that memoizes consumed elements, so it can be
+        indexed and re-iterated even when backed by a one-shot iterator.
+        Repeated `stream[i]` becomes amortized O(1).
+        """
+        if isinstance(self, _CachedStream):
+            return self
+        return _CachedStream(self)
 
     def append(self, stream: "Stream[T]") -> "Stream[T]":
         """Append the stream after this one"""
@@ -200,6 +670,13 @@ class Stream(Generic[T]):
         Creates a list with the elements of this stream.
         Thus, the stream must be bounded.
         """
+        if type(self) is Stream:
+            if not self._ops:
+                return list(self._stream)
+
+            values = []
+            self._run(values.append)
+            return values
         return list(self)
 
     def tuple(self) -> Tuple[T]:
@@ -207,6 +684,8 @@ class Stream(Generic[T]):
         Creates a tuple from this Stream.
         Equivalent to `tuple(self)`
         """
+        if type(self) is Stream and not self._ops:
+            return tuple(self._stream)
         return tuple(self)
 
     def get(self, position: int) -> T:
@@ -220,67 +699,51 @@ class Stream(Generic[T]):
 
     def __iter__(self) -> Iterator[T]:
         """Iterates over the elements of this stream."""
-        return self._stream.__iter__()
+        iterator = self._stream.__iter__()
+
+        for kind, function, _ in self._ops:
+            iterator = map(function, iterator) if kind == "map" else filter(function, iterator)
+
+        return iterator
 
 
 class CatStream(Stream[T]):
+    __slots__ = ("_streams",)
+
     _streams: Tuple[Iterable[T]]
 
     def __init__(self, *streams: Iterable[T]) -> None:
         self._streams = streams
 
     def __iter__(self) -> Iterator[T]:
-        for stream in self._streams:
-            for value in stream:
-                yield value
+        return chain.from_iterable(self._streams)
+
+    def __length_hint__(self) -> int:
+        return sum(operator.length_hint(stream) for stream in self._streams)
 
 
 class ZipStream(Stream[Tuple[T]]):
+    __slots__ = ("_streams",)
+
     _streams: Tuple[Iterable[T]]
 
     def __init__(self, *streams: Iterable[T]) -> None:
         self._streams = streams
 
     def __iter__(self) -> Iterator[Tuple[T]]:
-        for values in zip(*self._streams):
-            yield values
+        streams = self._streams
+        constructor = _ZIP_ITERS.get(len(streams))
 
-class _DropStream(Stream[T]):
-    stream: Iterable[T]
-    predicate: Callable[[T], bool]
-
-    def __init__(self, stream: Iterable[T], predicate: Callable[[T], bool]):
-        self.stream = stream
-        self.predicate = predicate
-
-    def __iter__(self) -> Iterator[T]:
-        dropping = True
-
-        for value in self.stream:
-            if dropping:
-                if self.predicate(value):
-                    continue
-                else:
-                    dropping = False
-
-            yield value
-
-class _TakeStream(Stream[T]):
-    stream: Iterable[T]
-    predicate: Callable[[T], bool]
+        if constructor is not None:
+            return constructor(streams)
+        return zip(*streams)
 
-    def __init__(self, stream: Iterable[T], predicate: Callable[[T], bool]):
-        self.stream = stream
-        self.predicate = predicate
-
-    def __iter__(self) -> Iterator[T]:
-        for value in self.stream:
-            if self.predicate(value):
-                yield value
-            else:
-                break
+    def __length_hint__(self) -> int:
+        return min((operator.length_hint(stream) for stream in self._streams), default=0)
 
 class _OnlyStream(Stream[T]):
+    __slots__ = ("stream", "length")
+
     stream: Iterable[T]
     length: int
 
@@ -289,15 +752,19 @@ class _OnlyStream(Stream[T]):
         self.length = length
 
     def __iter__(self) -> Iterator[T]:
-        for value,_ in zip(self.stream, range(self.length)):
-            yield value
-    
+        return islice(self.stream.__iter__(), self.length)
+
+    def __length_hint__(self) -> int:
+        return min(self.length, operator.length_hint(self.stream))
+
     def get(self, position:int):
         if position >= self.length:
             raise IndexError("Index out of bounds")
-        return _getitem(self.stream, position) 
+        return _getitem(self.stream, position)
 
 class _SkipStream(Stream[T]):
+    __slots__ = ("stream", "length")
+
     stream: Iterable[T]
     length: int
 
@@ -306,12 +773,63 @@ class _SkipStream(Stream[T]):
         self.length = length
 
     def __iter__(self) -> Iterator[T]:
-        iter = self.stream.__iter__()
-        for value, _ in zip(iter, range(self.length)):
-            pass
-        
-        for value in iter:
-            yield value
-        
+        return islice(self.stream.__iter__(), self.length, None)
+
+    def __length_hint__(self) -> int:
+        return max(0, operator.length_hint(self.stream) - self.length)
+
     def get(self, position:int):
-        return _getitem(self.stream, position+self.length)
\ No newline at end of file
+        return _getitem(self.stream, position+self.length)
+
+class _CachedStream(Stream[T]):
+    """A stream memoizing consumed elements in a lazily grown list."""
+
+    __slots__ = ("_iter", "_cache", "_done")
+
+    _iter: Iterator[T]
+    _cache: List[T]
+    _done: bool
+
+    def __init__(self, stream: Iterable[T]):
+        self._iter = stream.__iter__()
+        self._cache = []
+        self._done = False
+
+    def _fill(self, position: int) -> bool:
+        """Consumes the source until the cache covers the position; returns whether it does."""
+        cache = self._cache
+
+        if self._done:
+            return position < len(cache)
+
+        append = cache.append
+        next_value = self._iter.__next__
+
+        try:
+            while len(cache) <= position:
+                append(next_value())
+        except StopIteration:
+            self._done = True
+            return False
+
+        return True
+
+    def __iter__(self) -> Iterator[T]:
+        cache = self._cache
+        position = 0
+
+        while position < len(cache) or self._fill(position):
+            yield cache[position]
+            position += 1
+
+    def __length_hint__(self) -> int:
+        hint = 0 if self._done else operator.length_hint(self._iter)
+        return len(self._cache) + hint
+
+    def get(self, position: int) -> T:
+        if position < len(self._cache) or self._fill(position):
+            return self._cache[position]
+        raise IndexError("Index out of bounds")
+
+_EMPTY_STREAM: Stream = Stream(())
+"""Shared empty stream, returned wherever an absent value yields no elements."""